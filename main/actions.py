@@ -1,30 +1,122 @@
-import json
+import atexit
 import os
+import queue
+import shutil
 import smtplib
+import subprocess
+import sys
+import threading
+import time
 import logging
+import logging.handlers
+import orjson
+from collections import deque
+from itertools import islice
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 
+# Action configuration file, reloaded when its mtime changes
+CONFIG_FILE = 'actions_config.json'
+
+# Maximum number of alerts kept in history
+HISTORY_LIMIT = 1000
+
+# The history log is compacted back to HISTORY_LIMIT lines once it reaches this size
+HISTORY_COMPACT_AT = 2 * HISTORY_LIMIT
+
+# Maximum number of alerts waiting for the background worker
+QUEUE_SIZE = 256
+
 class Actions:
-    def __init__(self):
+    def __init__(self, sysstat=None):
+        self.sysstat = sysstat
         self.config = self.load_config()
         self.setup_logging()
+        self.setup_history()
+        
+        # Resolve notification helpers once instead of via the shell per alert
+        self._notify_send = shutil.which("notify-send")
+        self._osascript = shutil.which("osascript")
+        
+        # SMTP connection reused across alerts, opened on first email
+        self._smtp = None
+        self._smtp_config = None
+        atexit.register(self._close_smtp)
+        
+        # Alert name -> [last notified, current cooldown, last seen firing] for repeat suppression
+        self._recent = {}
+        self._recent_lock = threading.Lock()
+        
+        # Alert name -> name-specific handler, resolved on first sight
+        self._name_handler_cache = {}
+        
+        # Alert I/O (email, logging, history, notifications) runs off the monitor loop
+        self._queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self._worker_thread = threading.Thread(
+            target=self._worker, name="sysmon-actions", daemon=True
+        )
+        self._worker_thread.start()
     
     def load_config(self):
         """Load action configuration from JSON file."""
-        config_file = 'actions_config.json'
+        config_file = CONFIG_FILE
         
         if not os.path.exists(config_file):
             self._create_default_config(config_file)
         
+        self._failed_mtime = None
         try:
-            with open(config_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+            self._config_mtime = os.stat(config_file).st_mtime_ns
+            return self._read_config(config_file)
+        except (orjson.JSONDecodeError, ValueError, OSError) as e:
             print(f"Error loading config: {e}")
+            self._config_mtime = None
             return {}
     
+    def maybe_reload(self):
+        """
+        Reload the configuration if actions_config.json changed on disk.
+        
+        Cheap enough to call every tick: only the file's mtime is checked
+        unless it changed. Log and history file paths apply on restart.
+        
+        Returns:
+            True if a new configuration was loaded
+        """
+        try:
+            mtime = os.stat(CONFIG_FILE).st_mtime_ns
+        except OSError:
+            return False
+        
+        if mtime == self._config_mtime:
+            return False
+        
+        # The mtime is only recorded once the file reads cleanly, so a
+        # half-written save is retried on the next tick
+        try:
+            config = self._read_config(CONFIG_FILE)
+        except (orjson.JSONDecodeError, ValueError, OSError) as e:
+            if mtime != self._failed_mtime:
+                print(f"Error reloading config: {e}, keeping previous config")
+                self._failed_mtime = mtime
+            return False
+        
+        self.config = config
+        self._config_mtime = mtime
+        self._failed_mtime = None
+        return True
+    
+    def _read_config(self, config_file):
+        """Read and parse a configuration file. Raises ValueError if it isn't an object."""
+        with open(config_file, 'rb') as f:
+            config = orjson.loads(f.read())
+        
+        if not isinstance(config, dict):
+            raise ValueError("config file must contain a JSON object")
+        
+        return config
+    
     def _create_default_config(self, config_file):
         """Create default actions_config.json file."""
         default_config = {
@@ -37,234 +129,549 @@ class Actions:
                 "recipient_email": "admin@example.com"
             },
             "log_file": "system_alerts.log",
-            "alert_history": "alert_history.json"
+            "alert_history": "alert_history.jsonl",
+            "alert_cooldown": 300,
+            "alert_cooldown_max": 3600
         }
         
-        with open(config_file, 'w') as f:
-            json.dump(default_config, f, indent=4)
+        with open(config_file, 'wb') as f:
+            f.write(orjson.dumps(default_config, option=orjson.OPT_INDENT_2))
         
         print(f"Created default config file: {config_file}")
     
     def setup_logging(self):
-        """Setup logging configuration."""
+        """Setup a dedicated rotating alert logger."""
         log_file = self.config.get('log_file', 'system_alerts.log')
-        logging.basicConfig(
-            filename=log_file,
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
+        self.logger = logging.getLogger("sysmon.alerts")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        
+        # Attach the handler only once, even with several Actions instances
+        if not self.logger.handlers:
+            handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=5_000_000, backupCount=3
+            )
+            handler.setFormatter(
+                logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            )
+            self.logger.addHandler(handler)
     
-    def execute(self, alert):
+    def setup_history(self):
+        """Load recent alert history and open the history log for appending."""
+        history_file = self.config.get('alert_history', 'alert_history.jsonl')
+        self._history = deque(maxlen=HISTORY_LIMIT)
+        self._history_lock = threading.Lock()
+        
+        self._history_file = history_file
+        
+        records, legacy, line_count, unparsed = self._load_history(history_file)
+        self._history.extend(records)
+        self._history_lines = line_count
+        
+        # Never compact over lines we couldn't read
+        self._history_compactable = not unparsed
+        
+        if legacy or (line_count > HISTORY_LIMIT and self._history_compactable):
+            self._compact_history()
+        
+        self._history_fh = open(history_file, 'ab')
+    
+    def _load_history(self, history_file):
         """
-        Execute appropriate actions based on alert severity or name.
+        Read the most recent records from the history file.
+        
+        Args:
+            history_file: Path to the JSONL (or legacy JSON array) history
+            
+        Returns:
+            Tuple of (records, legacy, line_count, unparsed). records are
+            (name, severity, current_value, timestamp) tuples, legacy is True
+            for an old JSON array file, and unparsed counts kept lines that
+            could not be read.
+        """
+        if not os.path.exists(history_file):
+            return [], False, 0, 0
+        
+        with open(history_file, 'rb') as f:
+            data = f.read()
+        
+        # Legacy alert_history.json: a single indented array of objects
+        try:
+            legacy = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            legacy = None
+        
+        if isinstance(legacy, list) and all(isinstance(record, dict) for record in legacy):
+            records = [self._history_record(record) for record in legacy[-HISTORY_LIMIT:]]
+            return [record for record in records if record is not None], True, len(legacy), 0
+        
+        lines = data.splitlines()
+        records = []
+        unparsed = 0
+        for line in lines[-HISTORY_LIMIT:]:
+            if not line.strip():
+                continue
+            try:
+                record = self._history_record(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                record = None
+            
+            if record is None:
+                unparsed += 1
+            else:
+                records.append(record)
+        
+        return records, False, len(lines), unparsed
+    
+    def _history_record(self, record):
+        """
+        Convert a stored history entry to a record tuple.
+        
+        Entries are [name, severity, current_value, timestamp] lists; the
+        legacy JSON array format stored objects with the same fields.
+        
+        Returns:
+            (name, severity, current_value, timestamp) tuple, or None if the
+            entry has any other shape or name, severity or timestamp is not
+            a string
+        """
+        if isinstance(record, dict):
+            record = (record.get('name'), record.get('severity'),
+                      record.get('current_value'), record.get('timestamp'))
+        elif isinstance(record, list) and len(record) == 4:
+            record = tuple(record)
+        else:
+            return None
+        
+        name, severity, _, timestamp = record
+        if not (isinstance(name, str) and isinstance(severity, str) and isinstance(timestamp, str)):
+            return None
+        
+        return record
+    
+    def _compact_history(self):
+        """Rewrite the history log to the in-memory records."""
+        with self._history_lock:
+            records = list(self._history)
+        
+        self._rewrite_history(self._history_file, records)
+        
+        # Reset even on failure so a broken disk isn't retried on every append
+        self._history_lines = len(records)
+    
+    def _rewrite_history(self, history_file, records):
+        """Replace the history file with records via a temp file."""
+        tmp_file = history_file + '.tmp'
+        
+        try:
+            with open(tmp_file, 'wb') as f:
+                for record in records:
+                    f.write(orjson.dumps(record) + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, history_file)
+        except OSError as e:
+            print(f"Error compacting alert history: {e}")
+    
+    def execute(self, alert, ts_iso=None, ts_str=None):
+        """
+        Queue an alert for the background worker without blocking.
+        
+        If the queue is full the oldest pending alert is dropped.
         
         Args:
-            alert: Dictionary containing alert information
-                   {name, severity, current_value}
+            alert: Alert with name, severity and current_value
+            ts_iso: ISO timestamp for the alert (defaults to now)
+            ts_str: Human-readable timestamp for the alert (defaults to now)
+        """
+        if ts_iso is None or ts_str is None:
+            now = datetime.now()
+            ts_iso = ts_iso or now.isoformat()
+            ts_str = ts_str or now.strftime('%Y-%m-%d %H:%M:%S')
+        
+        item = (alert, ts_iso, ts_str)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+            except queue.Empty:
+                pass
+            self._queue.put_nowait(item)
+    
+    def flush(self):
+        """Block until all queued alerts have been handled."""
+        self._queue.join()
+    
+    def _worker(self):
+        """Handle queued alerts one at a time."""
+        while True:
+            alert, ts_iso, ts_str = self._queue.get()
+            out = []
+            try:
+                self._dispatch(alert, ts_iso, ts_str, out)
+            except Exception as e:
+                out.append(f"   ✗ Failed to handle alert: {e}")
+            finally:
+                self._write(out)
+                self._queue.task_done()
+    
+    def _write(self, out):
+        """Write an alert's buffered output lines with a single write."""
+        if not out:
+            return
+        
+        try:
+            sys.stdout.write("\n".join(out) + "\n")
+            sys.stdout.flush()
+        except (OSError, ValueError):
+            # stdout closed or broken; keep handling alerts regardless
+            pass
+    
+    def _dispatch(self, alert, ts_iso, ts_str, out):
         """
-        severity = alert.get("severity", "info")
-        name = alert.get("name", "Unknown Alert")
+        Execute appropriate actions based on alert severity or name.
+        
+        Handlers append their console output to out instead of printing.
+        """
+        severity = alert.severity
+        name = alert.name
         
         # Match based on severity
-        if severity == "critical":
-            self._handle_critical(alert)
-        elif severity == "warning":
-            self._handle_warning(alert)
-        elif severity == "info":
-            self._handle_info(alert)
+        handler = self._SEVERITY_HANDLERS.get(severity)
+        if handler is not None:
+            handler(self, alert, ts_iso, ts_str, out)
         
         # Match based on specific alert names
-        if "CPU" in name:
-            self._handle_cpu_alert(alert)
-        elif "Memory" in name or "RAM" in name:
-            self._handle_memory_alert(alert)
-        elif "Disk" in name:
-            self._handle_disk_alert(alert)
-    
-    def _handle_critical(self, alert):
+        try:
+            handler = self._name_handler_cache[name]
+        except KeyError:
+            handler = self._name_handler_cache[name] = self._resolve_name_handler(name)
+        
+        if handler is not None:
+            handler(self, alert, out)
+    
+    def _resolve_name_handler(self, name):
+        """Return the handler for the first keyword found in name, or None."""
+        for keyword, handler in self._NAME_HANDLERS:
+            if keyword in name:
+                return handler
+        
+        return None
+    
+    def _handle_critical(self, alert, ts_iso, ts_str, out):
         """Handle critical severity alerts."""
-        print(f"🚨 CRITICAL ALERT: {alert['name']}")
-        print(f"   Current Value: {alert['current_value']}")
+        out.append(f"🚨 CRITICAL ALERT: {alert.name}")
+        out.append(f"   Current Value: {alert.current_value}")
         
         # Log to file
-        logging.critical(f"{alert['name']} - Value: {alert['current_value']}")
+        self.logger.critical("%s - Value: %s", alert.name, alert.current_value)
         
-        # Send email notification
-        self._send_email(alert)
+        # Email and desktop notifications back off while the alert keeps firing
+        notify = self._should_notify(alert.name)
+        
+        # Send email notification; a failed send doesn't start the cooldown
+        if notify:
+            if self._send_email(alert, ts_str, out):
+                self._mark_notified(alert.name)
+        else:
+            out.append("   → Repeat alert, notifications suppressed (cooldown)")
         
         # Save to alert history
-        self._save_to_history(alert)
+        self._save_to_history(alert, ts_iso, out)
         
         # Play system beep or notification sound
-        self._system_notification(alert)
+        if notify:
+            self._system_notification(alert, out)
     
-    def _handle_warning(self, alert):
+    def _handle_warning(self, alert, ts_iso, ts_str, out):
         """Handle warning severity alerts."""
-        print(f"⚠️  WARNING: {alert['name']}")
-        print(f"   Current Value: {alert['current_value']}")
+        out.append(f"⚠️  WARNING: {alert.name}")
+        out.append(f"   Current Value: {alert.current_value}")
         
         # Log to file
-        logging.warning(f"{alert['name']} - Value: {alert['current_value']}")
+        self.logger.warning("%s - Value: %s", alert.name, alert.current_value)
         
         # Save to alert history
-        self._save_to_history(alert)
+        self._save_to_history(alert, ts_iso, out)
     
-    def _handle_info(self, alert):
+    def _handle_info(self, alert, ts_iso, ts_str, out):
         """Handle info severity alerts."""
-        print(f"ℹ️  INFO: {alert['name']}")
-        print(f"   Current Value: {alert['current_value']}")
+        out.append(f"ℹ️  INFO: {alert.name}")
+        out.append(f"   Current Value: {alert.current_value}")
         
         # Log to file
-        logging.info(f"{alert['name']} - Value: {alert['current_value']}")
+        self.logger.info("%s - Value: %s", alert.name, alert.current_value)
     
-    def _handle_cpu_alert(self, alert):
+    def _handle_cpu_alert(self, alert, out):
         """Specific actions for CPU-related alerts."""
-        print(f"   → CPU-specific action: Checking top processes...")
-        # Could integrate with SysStat to get top CPU processes
+        out.append(f"   → CPU-specific action: Checking top processes...")
+        self._report_top_processes('cpu_percent', out)
         # Could attempt to kill or throttle high-CPU processes
     
-    def _handle_memory_alert(self, alert):
+    def _handle_memory_alert(self, alert, out):
         """Specific actions for memory-related alerts."""
-        print(f"   → Memory-specific action: Clearing cache recommended...")
+        out.append(f"   → Memory-specific action: Clearing cache recommended...")
+        self._report_top_processes('memory_percent', out)
         # Could trigger cache clearing
         # Could restart memory-intensive services
     
-    def _handle_disk_alert(self, alert):
+    def _handle_disk_alert(self, alert, out):
         """Specific actions for disk-related alerts."""
-        print(f"   → Disk-specific action: Check for large files...")
+        out.append(f"   → Disk-specific action: Check for large files...")
         # Could trigger cleanup scripts
         # Could archive old logs
     
-    def _send_email(self, alert):
-        """Send email notification for critical alerts."""
+    def _should_notify(self, name):
+        """
+        Decide whether a repeat alert should send email/desktop notifications.
+        
+        The first alert always notifies; repeats within the cooldown are
+        suppressed.
+        """
+        now = time.monotonic()
+        
+        with self._recent_lock:
+            entry = self._recent.get(name)
+            return entry is None or now - entry[0] >= entry[1]
+    
+    def _mark_notified(self, name):
+        """
+        Start the cooldown after a successful notification.
+        
+        Each time the alert notifies again after the cooldown expires, the
+        cooldown doubles (up to alert_cooldown_max).
+        """
+        base = self.config.get('alert_cooldown', 300)
+        cap = self.config.get('alert_cooldown_max', 3600)
+        now = time.monotonic()
+        
+        with self._recent_lock:
+            entry = self._recent.get(name)
+            if entry is None:
+                self._recent[name] = [now, base, now]
+            else:
+                entry[0] = now
+                entry[1] = min(entry[1] * 2, cap)
+                entry[2] = now
+    
+    def clear_cooldowns(self, active_names=()):
+        """
+        Track which alerts fired on this tick and reset stale backoffs.
+        
+        An alert's backoff is only dropped once it has been quiet for its
+        current cooldown, so a value hovering around the threshold keeps it.
+        """
+        now = time.monotonic()
+        
+        with self._recent_lock:
+            expired = []
+            for name, entry in self._recent.items():
+                if name in active_names:
+                    entry[2] = now
+                elif now - entry[2] >= entry[1]:
+                    expired.append(name)
+            
+            for name in expired:
+                del self._recent[name]
+    
+    def _report_top_processes(self, sort_by, out):
+        """Report the top processes, only computed when a handler needs them."""
+        if self.sysstat is None:
+            return
+        
+        for proc in self.sysstat.top_processes(n=5, sort_by=sort_by):
+            out.append(f"     {proc['pid']:>7} {proc['name']}: {proc[sort_by] or 0:.1f}%")
+    
+    # Dispatch tables built once at class creation
+    _SEVERITY_HANDLERS = {
+        "critical": _handle_critical,
+        "warning": _handle_warning,
+        "info": _handle_info
+    }
+    
+    _NAME_HANDLERS = (
+        ("CPU", _handle_cpu_alert),
+        ("Memory", _handle_memory_alert),
+        ("RAM", _handle_memory_alert),
+        ("Disk", _handle_disk_alert)
+    )
+    
+    def _send_email(self, alert, ts_str, out):
+        """
+        Send email notification for critical alerts.
+        
+        Returns:
+            False if the send failed, True otherwise (including when email
+            is disabled)
+        """
         email_config = self.config.get('email', {})
         
         if not email_config.get('enabled', False):
-            return
+            return True
         
         try:
             msg = MIMEMultipart()
             msg['From'] = email_config['sender_email']
             msg['To'] = email_config['recipient_email']
-            msg['Subject'] = f"🚨 System Alert: {alert['name']}"
+            msg['Subject'] = f"🚨 System Alert: {alert.name}"
             
             body = f"""
 System Alert Triggered
 ======================
 
-Alert: {alert['name']}
-Severity: {alert['severity']}
-Current Value: {alert['current_value']}
-Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Alert: {alert.name}
+Severity: {alert.severity}
+Current Value: {alert.current_value}
+Time: {ts_str}
 
 Please check the system immediately.
             """
             
             msg.attach(MIMEText(body, 'plain'))
             
-            server = smtplib.SMTP(email_config['smtp_server'], email_config['smtp_port'])
-            server.starttls()
-            server.login(email_config['sender_email'], email_config['sender_password'])
-            server.send_message(msg)
-            server.quit()
+            try:
+                self._get_smtp(email_config).send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # The server dropped the cached connection; reconnect once
+                self._close_smtp()
+                self._get_smtp(email_config).send_message(msg)
             
-            print("   ✓ Email notification sent")
+            out.append("   ✓ Email notification sent")
+            return True
         except Exception as e:
-            print(f"   ✗ Failed to send email: {e}")
+            self._close_smtp()
+            out.append(f"   ✗ Failed to send email: {e}")
+            return False
     
-    def _save_to_history(self, alert):
-        """Save alert to history file for tracking."""
-        history_file = self.config.get('alert_history', 'alert_history.json')
+    def _get_smtp(self, email_config):
+        """Return a logged-in SMTP connection, reusing the cached one if alive."""
+        # Settings changed by a config reload need a fresh connection
+        if self._smtp is not None and email_config != self._smtp_config:
+            self._close_smtp()
         
-        # Load existing history
-        history = []
-        if os.path.exists(history_file):
+        if self._smtp is not None:
             try:
-                with open(history_file, 'r') as f:
-                    history = json.load(f)
-            except json.JSONDecodeError:
-                history = []
-        
-        # Add new alert with timestamp
-        alert_record = {
-            "timestamp": datetime.now().isoformat(),
-            "name": alert['name'],
-            "severity": alert['severity'],
-            "current_value": alert['current_value']
-        }
+                self._smtp.noop()
+                return self._smtp
+            except smtplib.SMTPServerDisconnected:
+                self._close_smtp()
+        
+        server = smtplib.SMTP(email_config['smtp_server'], email_config['smtp_port'])
+        try:
+            server.starttls()
+            server.login(email_config['sender_email'], email_config['sender_password'])
+        except Exception:
+            server.close()
+            raise
+        
+        self._smtp = server
+        self._smtp_config = email_config
+        return server
+    
+    def _close_smtp(self):
+        """Close the cached SMTP connection, if any."""
+        server, self._smtp = self._smtp, None
+        if server is None:
+            return
         
-        history.append(alert_record)
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+    
+    def _save_to_history(self, alert, ts_iso, out):
+        """Save alert to history file for tracking."""
+        # Stored as a flat (name, severity, current_value, timestamp) tuple
+        alert_record = (alert.name, alert.severity, alert.current_value, ts_iso)
         
-        # Keep only last 1000 alerts
-        if len(history) > 1000:
-            history = history[-1000:]
+        # Keep the last HISTORY_LIMIT alerts in memory and append to the log
+        with self._history_lock:
+            self._history.append(alert_record)
         
-        # Save updated history
         try:
-            with open(history_file, 'w') as f:
-                json.dump(history, f, indent=4)
+            self._history_fh.write(orjson.dumps(alert_record) + b"\n")
+            self._history_fh.flush()
+            self._history_lines += 1
+            
+            # Keep the log bounded while the monitor runs
+            if self._history_compactable and self._history_lines >= HISTORY_COMPACT_AT:
+                self._history_fh.close()
+                self._compact_history()
+                self._history_fh = open(self._history_file, 'ab')
         except Exception as e:
-            print(f"   ✗ Failed to save alert history: {e}")
+            out.append(f"   ✗ Failed to save alert history: {e}")
     
-    def _system_notification(self, alert):
+    def _system_notification(self, alert, out):
         """Send system notification (platform-dependent)."""
+        message = f"{alert.name}: {alert.current_value}"
+        
         try:
+            # For macOS
+            if sys.platform == 'darwin':
+                if self._osascript:
+                    message = message.replace('\\', '\\\\').replace('"', '\\"')
+                    self._spawn([
+                        self._osascript, "-e",
+                        f'display notification "{message}" with title "System Alert"'
+                    ])
             # For Linux
-            if os.name == 'posix':
-                os.system(f'notify-send "System Alert" "{alert["name"]}: {alert["current_value"]}"')
+            elif os.name == 'posix':
+                if self._notify_send:
+                    self._spawn([self._notify_send, "System Alert", message])
             # For Windows
             elif os.name == 'nt':
                 # Could use win10toast or plyer for notifications
-                print("   → System notification (Windows implementation needed)")
-            # For macOS
-            elif os.uname().sysname == 'Darwin':
-                os.system(f'osascript -e \'display notification "{alert["name"]}: {alert["current_value"]}" with title "System Alert"\'')
+                out.append("   → System notification (Windows implementation needed)")
         except Exception as e:
-            print(f"   ✗ System notification failed: {e}")
+            out.append(f"   ✗ System notification failed: {e}")
+    
+    def _spawn(self, args):
+        """Start a notification helper without a shell and without waiting on it."""
+        subprocess.Popen(
+            args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True
+        )
     
     def get_alert_history(self, limit=10):
-        """Retrieve recent alert history."""
-        history_file = self.config.get('alert_history', 'alert_history.json')
-        
-        if not os.path.exists(history_file):
-            return []
+        """Retrieve recent alert history as a list of record dictionaries."""
+        with self._history_lock:
+            size = len(self._history)
+            start = max(0, size - limit) if limit else 0
+            records = list(islice(self._history, start, size))
         
-        try:
-            with open(history_file, 'r') as f:
-                history = json.load(f)
-                return history[-limit:] if limit else history
-        except Exception as e:
-            print(f"Error reading history: {e}")
-            return []
+        return [
+            {
+                "timestamp": timestamp,
+                "name": name,
+                "severity": severity,
+                "current_value": current_value
+            }
+            for name, severity, current_value, timestamp in records
+        ]
 
 
 # Example usage
 if __name__ == "__main__":
+    from rules import Alert
+    
     actions = Actions()
     
     # Test with different alert types
     test_alerts = [
-        {
-            "name": "Critical CPU Usage",
-            "severity": "critical",
-            "current_value": 97.5
-        },
-        {
-            "name": "High Memory Usage",
-            "severity": "warning",
-            "current_value": 87.3
-        },
-        {
-            "name": "Low CPU Frequency",
-            "severity": "info",
-            "current_value": 800.0
-        }
+        Alert("Critical CPU Usage", "critical", 97.5),
+        Alert("High Memory Usage", "warning", 87.3),
+        Alert("Low CPU Frequency", "info", 800.0)
     ]
     
     print("=== Testing Actions ===\n")
     for alert in test_alerts:
         actions.execute(alert)
-        print()
+    actions.flush()
     
     # Show recent history
     print("\n=== Recent Alert History ===")
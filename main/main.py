@@ -9,10 +9,18 @@ from stats import SysStat
 from rules import RulesEngine
 from actions import Actions
 import time
-import json
 import os
+import sys as system
+import orjson
 from datetime import datetime
 
+# Icons used when printing alerts, keyed by severity
+SEVERITY_ICON = {
+    'critical': '🚨',
+    'warning': '⚠️',
+    'info': 'ℹ️'
+}
+
 # 2. Initialize everything once
 def initialize():
     """Initialize all monitoring components."""
@@ -20,7 +28,7 @@ def initialize():
     
     sys = SysStat()
     rules = RulesEngine()
-    actions = Actions()
+    actions = Actions(sys)
     
     print("✓ All components loaded\n")
     
@@ -38,15 +46,15 @@ def load_config():
             "show_healthy_status": True
         }
         
-        with open(config_file, 'w') as f:
-            json.dump(default_config, f, indent=4)
+        with open(config_file, 'wb') as f:
+            f.write(orjson.dumps(default_config, option=orjson.OPT_INDENT_2))
         
         print(f"Created default config: {config_file}")
         return default_config
     
     try:
-        with open(config_file, 'r') as f:
-            return json.load(f)
+        with open(config_file, 'rb') as f:
+            return orjson.loads(f.read())
     except Exception as e:
         print(f"Error loading config: {e}, using defaults")
         return {"interval": 5, "verbose": True, "show_healthy_status": True}
@@ -71,52 +79,74 @@ def monitor(sys, rules, actions, config):
     print("=" * 60)
     
     iteration = 0
+    next_tick = time.monotonic()
     
     try:
         while True:
             iteration += 1
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            out = []
+            
+            # Format the tick's timestamps once and share them with all alerts
+            now = datetime.now()
+            timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
+            ts_iso = now.isoformat()
+            
+            # Pick up edited rules/config without restarting
+            if rules.maybe_reload():
+                out.append(f"[{timestamp}] 🔄 Reloaded rules")
+            if actions.maybe_reload():
+                out.append(f"[{timestamp}] 🔄 Reloaded actions config")
             
             # Get current system statistics
-            stats = sys.get_stats()
+            stats = sys.get_stats_flat()
             
             # Check stats against rules
             alerts = rules.check(stats)
             
+            # Alerts that stay quiet for their cooldown get their notification backoff reset
+            actions.clear_cooldowns({alert.name for alert in alerts})
+            
             if alerts:
                 # Print header for this check
-                print(f"\n[{timestamp}] Check #{iteration}")
-                print("-" * 60)
+                out.append(f"\n[{timestamp}] Check #{iteration}")
+                out.append("-" * 60)
                 
-                # Process each triggered alert
+                # Print human-readable info (UI responsibility)
                 for alert in alerts:
-                    # Print human-readable info (UI responsibility)
-                    severity_icon = {
-                        'critical': '🚨',
-                        'warning': '⚠️',
-                        'info': 'ℹ️'
-                    }.get(alert['severity'], '•')
-                    
-                    print(f"{severity_icon} {alert['name']}: {alert['current_value']}")
-                    
-                    # Execute the alert actions
-                    actions.execute(alert)
+                    severity_icon = SEVERITY_ICON.get(alert.severity, '•')
+                    out.append(f"{severity_icon} {alert.name}: {alert.current_value}")
                 
-                print("-" * 60)
+                out.append("-" * 60)
             
             else:
                 # Optional: print or log that system is healthy
                 if show_healthy and verbose:
                     if iteration % 10 == 0:  # Show every 10th check to reduce noise
-                        print(f"[{timestamp}] ✓ System healthy (check #{iteration})")
+                        out.append(f"[{timestamp}] ✓ System healthy (check #{iteration})")
+            
+            # One write per tick instead of a print() per line
+            if out:
+                system.stdout.write("\n".join(out) + "\n")
+                system.stdout.flush()
             
-            # Wait before next check
-            time.sleep(interval)
+            # Execute the alert actions (handled on the actions worker thread)
+            for alert in alerts:
+                actions.execute(alert, ts_iso=ts_iso, ts_str=timestamp)
+            
+            # Wait until the next tick deadline so work time doesn't cause drift
+            next_tick += interval
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind (e.g. system suspend); resync instead of bursting
+                next_tick = time.monotonic()
     
     except KeyboardInterrupt:
         # 5. Clean shutdown (CTRL+C)
         print("\n" + "=" * 60)
         print("🛑 Shutting down monitor...")
+        actions.flush()
         print("✓ Cleanup complete. Goodbye!")
 
 # 6. Optional: Single check mode
@@ -124,15 +154,20 @@ def run_once(sys, rules, actions):
     """Run a single check and exit."""
     print("📊 Running single check...\n")
     
-    stats = sys.get_stats()
+    stats = sys.get_stats_flat()
     alerts = rules.check(stats)
     
     if alerts:
+        now = datetime.now()
+        timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
+        ts_iso = now.isoformat()
+        
         print("Triggered Alerts:")
         print("-" * 60)
         for alert in alerts:
-            print(f"[{alert['severity'].upper()}] {alert['name']}: {alert['current_value']}")
-            actions.execute(alert)
+            print(f"[{alert.severity.upper()}] {alert.name}: {alert.current_value}")
+            actions.execute(alert, ts_iso=ts_iso, ts_str=timestamp)
+        actions.flush()
         print("-" * 60)
     else:
         print("✓ No alerts triggered - system is healthy!")
@@ -152,11 +187,7 @@ def show_history(actions, limit=20):
         return
     
     for record in history:
-        severity_icon = {
-            'critical': '🚨',
-            'warning': '⚠️',
-            'info': 'ℹ️'
-        }.get(record['severity'], '•')
+        severity_icon = SEVERITY_ICON.get(record['severity'], '•')
         
         print(f"{record['timestamp']} {severity_icon} [{record['severity'].upper()}] "
               f"{record['name']}: {record['current_value']}")
@@ -180,9 +211,6 @@ def show_menu():
 def main():
     """Main entry point with optional menu system."""
     
-    # Check for command-line arguments
-    import sys as system
-    
     # Initialize components
     sys, rules, actions = initialize()
     config = load_config()
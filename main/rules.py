@@ -1,5 +1,48 @@
-import json
+import operator
 import os
+import numpy as np
+import orjson
+
+# Rules file, reloaded when its mtime changes
+RULES_FILE = 'rules.json'
+
+# Comparison operators supported in rule conditions
+OPERATORS = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne
+}
+
+# Rules sharing a metric and operator are compared with one NumPy call only
+# from this group size on; below it a plain loop is faster
+VECTORIZE_MIN_RULES = 64
+
+# Reductions allowed as a trailing path segment, e.g. "cpu.per_core.max"
+REDUCERS = {
+    'max': np.max,
+    'min': np.min,
+    'mean': np.mean
+}
+
+# Metrics holding one value per core; rules must reduce them with a suffix
+ARRAY_METRICS = {'cpu.per_core'}
+
+class Alert:
+    """A triggered rule, passed from RulesEngine.check() to Actions."""
+    __slots__ = ("name", "severity", "current_value", "rule_key")
+    
+    def __init__(self, name, severity, current_value, rule_key=None):
+        self.name = name
+        self.severity = severity
+        self.current_value = current_value
+        self.rule_key = rule_key
+    
+    def __repr__(self):
+        return (f"Alert(name={self.name!r}, severity={self.severity!r}, "
+                f"current_value={self.current_value!r}, rule_key={self.rule_key!r})")
 
 class RulesEngine:
     def __init__(self):
@@ -7,17 +50,174 @@ class RulesEngine:
     
     def load_rules(self):
         """Load rules from JSON file. Create default rules if file doesn't exist."""
-        rules_file = 'rules.json'
+        rules_file = RULES_FILE
         
         if not os.path.exists(rules_file):
             self._create_default_rules(rules_file)
         
+        self._failed_mtime = None
         try:
-            with open(rules_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+            self._rules_mtime = os.stat(rules_file).st_mtime_ns
+            rules = self._read_rules(rules_file)
+        except (orjson.JSONDecodeError, ValueError, OSError) as e:
             print(f"Error loading rules: {e}")
-            return {}
+            self._rules_mtime = None
+            rules = {}
+        
+        self.compiled_rules = self._compile_rules(rules)
+        self._scalar_rules, self._by_metric = self._group_rules(self.compiled_rules)
+        return rules
+    
+    def maybe_reload(self):
+        """
+        Reload and recompile rules if rules.json changed on disk.
+        
+        Cheap enough to call every tick: only the file's mtime is checked
+        unless it changed.
+        
+        Returns:
+            True if new rules were loaded
+        """
+        try:
+            mtime = os.stat(RULES_FILE).st_mtime_ns
+        except OSError:
+            return False
+        
+        if mtime == self._rules_mtime:
+            return False
+        
+        # The mtime is only recorded once the file reads cleanly, so a
+        # half-written save is retried on the next tick
+        try:
+            rules = self._read_rules(RULES_FILE)
+        except (orjson.JSONDecodeError, ValueError, OSError) as e:
+            if mtime != self._failed_mtime:
+                print(f"Error reloading rules: {e}, keeping previous rules")
+                self._failed_mtime = mtime
+            return False
+        
+        self._rules_mtime = mtime
+        self._failed_mtime = None
+        self.compiled_rules = self._compile_rules(rules)
+        self._scalar_rules, self._by_metric = self._group_rules(self.compiled_rules)
+        self.rules = rules
+        return True
+    
+    def _read_rules(self, rules_file):
+        """Read and parse a rules file. Raises ValueError if it isn't an object."""
+        with open(rules_file, 'rb') as f:
+            rules = orjson.loads(f.read())
+        
+        if not isinstance(rules, dict):
+            raise ValueError("rules file must contain a JSON object")
+        
+        return rules
+    
+    def _compile_rules(self, rules):
+        """
+        Pre-parse rule conditions so check() does no string work.
+        
+        Args:
+            rules: Dictionary of rules as loaded from rules.json
+            
+        Returns:
+            List of (key, reducer, op_func, threshold, name, severity, rule_key) tuples
+        """
+        compiled = []
+        
+        for rule_name, rule in rules.items():
+            if not isinstance(rule, dict):
+                print(f"Skipping rule '{rule_name}': not an object")
+                continue
+            
+            name = rule.get("name")
+            severity = rule.get("severity")
+            condition = rule.get("condition")
+            if not isinstance(name, str) or not isinstance(severity, str):
+                print(f"Skipping rule '{rule_name}': missing name or severity")
+                continue
+            
+            parts = condition.split() if isinstance(condition, str) else []
+            if len(parts) != 3:
+                print(f"Skipping rule '{rule_name}': invalid condition")
+                continue
+            
+            metric_path, op, threshold = parts
+            op_func = OPERATORS.get(op)
+            if op_func is None:
+                print(f"Skipping rule '{rule_name}': unknown operator '{op}'")
+                continue
+            
+            try:
+                threshold = float(threshold)
+            except ValueError:
+                print(f"Skipping rule '{rule_name}': invalid threshold '{threshold}'")
+                continue
+            
+            # A trailing reducer segment aggregates an array metric
+            key, _, suffix = metric_path.rpartition('.')
+            reducer = REDUCERS.get(suffix) if key else None
+            if reducer is None:
+                key = metric_path
+            
+            if reducer is not None and key not in ARRAY_METRICS:
+                print(f"Skipping rule '{rule_name}': '.{suffix}' only applies to array metrics")
+                continue
+            
+            if reducer is None and key in ARRAY_METRICS:
+                print(f"Skipping rule '{rule_name}': '{key}' needs a .max, .min or .mean suffix")
+                continue
+            
+            compiled.append((
+                key,
+                reducer,
+                op_func,
+                threshold,
+                name,
+                severity,
+                rule_name
+            ))
+        
+        return compiled
+    
+    def _group_rules(self, compiled_rules):
+        """
+        Split compiled rules into per-rule checks and large vectorized groups.
+        
+        Rules sharing a metric, reducer and operator are grouped; groups of
+        at least VECTORIZE_MIN_RULES rules get a NumPy threshold array.
+        
+        Args:
+            compiled_rules: List produced by _compile_rules()
+            
+        Returns:
+            Tuple of (scalar_rules, vector_groups). scalar_rules keeps the
+            compiled tuples of small groups in rules.json order.
+            vector_groups maps (key, reducer, op_func) to a tuple of
+            (thresholds array, ((name, severity, rule_key), ...))
+        """
+        groups = {}
+        for compiled_rule in compiled_rules:
+            groups.setdefault(compiled_rule[:3], []).append(compiled_rule)
+        
+        scalar_rules = tuple(
+            compiled_rule for compiled_rule in compiled_rules
+            if len(groups[compiled_rule[:3]]) < VECTORIZE_MIN_RULES
+        )
+        
+        vector_groups = {
+            group: (
+                np.array([rule[3] for rule in members], dtype=np.float64),
+                tuple((rule[4], rule[5], rule[6]) for rule in members)
+            )
+            for group, members in groups.items()
+            if len(members) >= VECTORIZE_MIN_RULES
+        }
+        
+        # Alerts from vector groups are re-sorted into rules.json order
+        self._rule_order = {rule[6]: index for index, rule in enumerate(compiled_rules)}
+        
+        return scalar_rules, vector_groups
     
     def _create_default_rules(self, rules_file):
         """Create default rules.json file."""
@@ -59,106 +259,87 @@ class RulesEngine:
             }
         }
         
-        with open(rules_file, 'w') as f:
-            json.dump(default_rules, f, indent=4)
+        with open(rules_file, 'wb') as f:
+            f.write(orjson.dumps(default_rules, option=orjson.OPT_INDENT_2))
         
         print(f"Created default rules file: {rules_file}")
     
     def check(self, stats):
-        """Check stats against all rules and return triggered alerts."""
-        triggered = []
-        
-        for rule_name, rule in self.rules.items():
-            if self.evaluate(rule["condition"], stats):
-                triggered.append({
-                    "name": rule["name"],
-                    "severity": rule["severity"],
-                    "current_value": self.extract_value(rule["condition"], stats)
-                })
-        
-        return triggered
-    
-    def evaluate(self, condition, stats):
         """
-        Evaluate a condition string against stats.
+        Check stats against all rules and return triggered alerts.
         
         Args:
-            condition: String like "cpu.usage > 80" or "ram.percent > 85"
-            stats: Dictionary containing system statistics
-            
-        Returns:
-            Boolean indicating if condition is met
+            stats: Flat dictionary keyed by metric path, as returned by
+                   SysStat.get_stats_flat() (e.g. {"cpu.usage": 85.5})
         """
-        # Parse condition string
-        parts = condition.split()
-        if len(parts) != 3:
-            return False
-        
-        metric_path, operator, threshold = parts
-        threshold = float(threshold)
-        
-        # Get current value
-        current_value = self._get_nested_value(stats, metric_path)
-        
-        if current_value is None:
-            return False
+        triggered = []
+        get_value = stats.get
+        reduce_value = self._reduce_value
+        _round = round
         
-        # Evaluate based on operator
-        operators = {
-            '>': lambda x, y: x > y,
-            '<': lambda x, y: x < y,
-            '>=': lambda x, y: x >= y,
-            '<=': lambda x, y: x <= y,
-            '==': lambda x, y: x == y,
-            '!=': lambda x, y: x != y
-        }
+        for key, reducer, op_func, threshold, name, severity, rule_key in self._scalar_rules:
+            current_value = get_value(key)
+            if current_value is None:
+                continue
+            
+            if reducer is not None:
+                current_value = reduce_value(current_value, reducer)
+                if current_value is None:
+                    continue
+            
+            if op_func(current_value, threshold):
+                if isinstance(current_value, float):
+                    current_value = _round(current_value, 2)
+                
+                triggered.append(Alert(name, severity, current_value, rule_key))
         
-        op_func = operators.get(operator)
-        if op_func:
-            return op_func(current_value, threshold)
+        if not self._by_metric:
+            return triggered
         
-        return False
-    
-    def extract_value(self, condition, stats):
-        """
-        Extract the current value from stats based on condition.
-        
-        Args:
-            condition: String like "cpu.usage > 80"
-            stats: Dictionary containing system statistics
+        # Large groups: one vectorized compare per (metric, reducer, operator)
+        vector_hits = False
+        for (key, reducer, op_func), (thresholds, targets) in self._by_metric.items():
+            current_value = get_value(key)
+            if current_value is not None and reducer is not None:
+                current_value = reduce_value(current_value, reducer)
             
-        Returns:
-            Current value of the metric (rounded if float)
-        """
-        metric_path = condition.split()[0]
-        value = self._get_nested_value(stats, metric_path)
+            if current_value is None:
+                continue
+            
+            mask = op_func(current_value, thresholds)
+            if not mask.any():
+                continue
+            
+            if isinstance(current_value, float):
+                current_value = _round(current_value, 2)
+            
+            for i in np.flatnonzero(mask):
+                name, severity, rule_key = targets[i]
+                triggered.append(Alert(name, severity, current_value, rule_key))
+            vector_hits = True
         
-        if isinstance(value, float):
-            return round(value, 2)
+        # Report alerts in rules.json order
+        if vector_hits:
+            rule_order = self._rule_order
+            triggered.sort(key=lambda alert: rule_order[alert.rule_key])
         
-        return value
+        return triggered
     
-    def _get_nested_value(self, data, path):
+    def _reduce_value(self, current_value, reducer):
         """
-        Get value from nested dictionary using dot notation.
+        Apply a NumPy reducer to an array metric.
         
         Args:
-            data: Dictionary to search
-            path: Dot-separated path (e.g., 'cpu.usage', 'ram.percent')
+            current_value: Metric value from the flat stats
+            reducer: NumPy reduction from REDUCERS
             
         Returns:
-            Value at the specified path or None if not found
+            Reduced value as a float, or None for an empty array
         """
-        keys = path.split('.')
-        value = data
+        if not len(current_value):
+            return None
         
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return None
-        
-        return value
+        return float(reducer(current_value))
 
 
 # Example usage
@@ -170,23 +351,17 @@ if __name__ == "__main__":
     
     # Example stats (simulate high CPU and RAM usage)
     example_stats = {
-        "cpu": {
-            "usage": 85.5,
-            "per_core": [82.0, 88.0, 85.0, 87.0],
-            "frequency": 2400.0
-        },
-        "ram": {
-            "total": 16.0,
-            "used": 14.5,
-            "available": 1.5,
-            "percent": 90.6
-        },
-        "disk": {
-            "total": 500.0,
-            "used": 420.0,
-            "free": 80.0,
-            "percent": 84.0
-        }
+        "cpu.usage": 85.5,
+        "cpu.per_core": [82.0, 88.0, 85.0, 87.0],
+        "cpu.frequency": 2400.0,
+        "ram.total": 16.0,
+        "ram.used": 14.5,
+        "ram.available": 1.5,
+        "ram.percent": 90.6,
+        "disk.total": 500.0,
+        "disk.used": 420.0,
+        "disk.free": 80.0,
+        "disk.percent": 84.0
     }
     
     # Check for triggered rules
@@ -195,6 +370,6 @@ if __name__ == "__main__":
     print("\n=== Triggered Rules ===")
     if triggered:
         for alert in triggered:
-            print(f"[{alert['severity'].upper()}] {alert['name']}: {alert['current_value']}")
+            print(f"[{alert.severity.upper()}] {alert.name}: {alert.current_value}")
     else:
         print("No rules triggered - system is healthy!")
\ No newline at end of file
@@ -1,51 +1,103 @@
+import heapq
+import numpy as np
 import psutil
 import pprint
+import time
+
+# Bytes per GiB
+_GIB = 1 << 30
+_PER_GIB = 1.0 / _GIB
+
+# Number of get_stats() calls between CPU frequency refreshes
+_FREQ_REFRESH_TICKS = 12
+
+# Per-process CPU usage is measured between two scans; this is the shortest
+# window that gives meaningful numbers
+_PROCESS_CPU_WINDOW = 0.5
+
+# A process scan is reused by alert handlers for this many seconds, so the
+# alerts of one tick share a single scan
+_PROCESS_SAMPLE_TTL = 2.0
 
 class SysStat:
 
-    def get_stats(self):
-        return {
-            "cpu": self._cpu_stats(),
-            "ram": self._ram_stats(),
-            "disk": self._disk_stats(),
-            "processes": self._processes(),
-            "temp": self._temp()
-        }
+    def __init__(self):
+        self._freq = None
+        self._freq_age = _FREQ_REFRESH_TICKS
+        self._proc_sample = None
+        self._proc_sample_time = None
 
-    def _cpu_stats(self):
-        return {
-            "usage": psutil.cpu_percent(interval=None),
-            "per_core": psutil.cpu_percent(interval=None, percpu=True),
-            "frequency": psutil.cpu_freq().current
-        }
+    def get_stats(self):
+        stats = {"cpu": {}, "ram": {}, "disk": {}}
+        for key, value in self.get_stats_flat().items():
+            group, name = key.split('.')
+            stats[group][name] = value
+        stats["temp"] = self._temp()
+        return stats
 
-    def _ram_stats(self):
+    def get_stats_flat(self):
+        """
+        Return cpu/ram/disk stats keyed by dotted path, e.g. "cpu.usage".
+        
+        This is what the rules engine consumes: one dict lookup per rule
+        instead of a nested walk. Temperatures are not included.
+        """
+        # One /proc/stat read; the aggregate is derived from the per-core values
+        per_core = np.asarray(psutil.cpu_percent(interval=None, percpu=True), dtype=np.float32)
         mem = psutil.virtual_memory()
-        return {
-            "total": round(mem.total / (1024**3),2),
-            "used": mem.used / (1024**3),
-            "available": mem.available / (1024**3),
-            "percent": mem.percent
-        }
-    
-    def _disk_stats(self):
         disk = psutil.disk_usage('/')
         return {
-            "total": disk.total / (1024**3),
-            "used": disk.used / (1024**3),
-            "free": disk.free / (1024**3),
-            "percent": disk.percent
+            "cpu.usage": round(float(per_core.mean()), 1) if per_core.size else 0.0,
+            "cpu.per_core": per_core,
+            "cpu.frequency": self._cpu_freq(),
+            "ram.total": round(mem.total * _PER_GIB, 2),
+            "ram.used": mem.used * _PER_GIB,
+            "ram.available": mem.available * _PER_GIB,
+            "ram.percent": mem.percent,
+            "disk.total": disk.total * _PER_GIB,
+            "disk.used": disk.used * _PER_GIB,
+            "disk.free": disk.free * _PER_GIB,
+            "disk.percent": disk.percent
         }
 
-    def _processes(self):
+    def _cpu_freq(self):
+        # Frequency rarely changes materially, so only refresh it every few ticks
+        if self._freq_age >= _FREQ_REFRESH_TICKS:
+            freq = psutil.cpu_freq()
+            self._freq = freq.current if freq else None
+            self._freq_age = 0
+        self._freq_age += 1
+        return self._freq
+
+    def top_processes(self, n=5, sort_by='cpu_percent'):
+        """Return the top n processes by cpu_percent or memory_percent."""
+        now = time.monotonic()
+        
+        if self._proc_sample_time is None:
+            # First call: prime per-process CPU counters
+            self._scan_processes()
+            self._proc_sample_time = now
+        
+        elapsed = now - self._proc_sample_time
+        if self._proc_sample is None or elapsed >= _PROCESS_SAMPLE_TTL:
+            # cpu_percent covers the time since the previous scan; make sure
+            # that window isn't too short to mean anything
+            if elapsed < _PROCESS_CPU_WINDOW:
+                time.sleep(_PROCESS_CPU_WINDOW - elapsed)
+            self._proc_sample = self._scan_processes()
+            self._proc_sample_time = time.monotonic()
+        
+        return heapq.nlargest(n, self._proc_sample, key=lambda x: x[sort_by] or 0)
+
+    def _scan_processes(self):
+        # process_iter reuses Process objects, so cpu_percent is relative to the last scan
         processes = []
         for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
             try:
                 processes.append(proc.info)
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
-        # Sort by CPU usage and return top 5
-        return sorted(processes, key=lambda x: x['cpu_percent'] or 0, reverse=True)[:5]
+        return processes
 
     def _temp(self):
         try:
@@ -61,8 +113,31 @@ class SysStat:
         except AttributeError:
             return {"status": "Temperature monitoring not supported on this platform"}
 
-    def display(self):
-        pprint.pprint(self.get_stats())
+    def display(self, verbose=False):
+        # Full nested dump for debugging; the summary avoids pprint's overhead
+        if verbose:
+            pprint.pprint(self.get_stats())
+            return
+
+        stats = self.get_stats_flat()
+        freq = stats["cpu.frequency"]
+        freq = f"{freq:.0f} MHz" if freq is not None else "n/a"
+        per_core = " ".join([f"{usage:.0f}%" for usage in stats["cpu.per_core"]])
+        temps = self._temp()
+        if "status" in temps:
+            temp = temps["status"]
+        else:
+            temp = ", ".join([f"{entry['label'] or name} {entry['current']:.1f}°C"
+                              for name, entries in temps.items() for entry in entries])
+        print(
+            f"CPU:  {stats['cpu.usage']:.1f}% @ {freq}\n"
+            f"      per core: {per_core}\n"
+            f"RAM:  {stats['ram.percent']:.1f}% - {stats['ram.used']:.2f} of "
+            f"{stats['ram.total']:.2f} GB used, {stats['ram.available']:.2f} GB available\n"
+            f"Disk: {stats['disk.percent']:.1f}% - {stats['disk.used']:.2f} of "
+            f"{stats['disk.total']:.2f} GB used, {stats['disk.free']:.2f} GB free\n"
+            f"Temp: {temp}"
+        )
 
 # Remove these lines or use them for testing only:
 # if __name__ == "__main__":